@@ -18,6 +18,11 @@ import requests
 class CourseGroupAdmin(admin.ModelAdmin):
     list_display = ('name', 'get_courses', 'description')
     search_fields = ('name', 'description')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related(
+            Prefetch('courses', queryset=Course.objects.only('id', 'name', 'exclusivity_group'))
+        )
     
     def get_courses(self, obj):
         return ", ".join([course.name for course in obj.courses.all()])
@@ -35,6 +40,11 @@ class LanguageGroupAdmin(admin.ModelAdmin):
     list_filter = ('grade_level',)
     search_fields = ('name',)
     filter_horizontal = ('periods', 'courses')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_periods().prefetch_related(
+            Prefetch('courses', queryset=Course.objects.only('id', 'name'))
+        )
     
     def get_courses(self, obj):
         return ", ".join([course.name for course in obj.courses.all()])
@@ -81,8 +91,11 @@ class CourseAdmin(CourseDistributionMixin, admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_counts()
+
     def get_student_count(self, obj):
-        return obj.students.count()
+        return obj.get_student_count()
     get_student_count.short_description = 'Registered Students'
     
     def get_available_space(self, obj):
@@ -90,7 +103,7 @@ class CourseAdmin(CourseDistributionMixin, admin.ModelAdmin):
     get_available_space.short_description = 'Available Spots'
 
     def get_section_count(self, obj):
-        created_sections = obj.sections.count()
+        created_sections = obj.sections_count
         total_sections = obj.num_sections
         color = '#28a745' if created_sections == total_sections else '#dc3545'
         return format_html('<span style="color: {}; font-weight: bold;">{}/{}</span>', 
@@ -256,7 +269,7 @@ class CourseAdmin(CourseDistributionMixin, admin.ModelAdmin):
         if course is None:
             return JsonResponse({'error': 'Course not found'}, status=404)
         
-        config = CourseTypeConfiguration.objects.filter(active=True).first()
+        config = CourseTypeConfiguration.get_active()
         
         # Get all registered student IDs (both in course.students and in sections)
         registered_ids = set(course.students.values_list('id', flat=True))
@@ -368,7 +381,7 @@ class CourseAdmin(CourseDistributionMixin, admin.ModelAdmin):
                 )
             
             # Get students and validate grade levels if configured
-            config = CourseTypeConfiguration.objects.filter(active=True).first()
+            config = CourseTypeConfiguration.get_active()
             students = User.objects.filter(id__in=student_ids, role='STUDENT')
             
             if not students.exists():
@@ -5,7 +5,8 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.contrib.admin.views.decorators import staff_member_required
-from ..models import Course, Section
+from django.db.models import Prefetch
+from ..models import Course, Section, User
 from ..scheduling.course_distributor import (
     distribute_course_students,
     distribute_all_courses,
@@ -35,7 +36,7 @@ class CourseDistributionMixin:
 
     def distribution_view(self, request):
         """Main view for course distribution management"""
-        courses = Course.objects.all()
+        courses = Course.objects.for_scheduler()
         course_data = []
         
         for course in courses:
@@ -101,8 +102,32 @@ def get_course_distribution_status(course_id: int) -> Dict[str, any]:
     """
     try:
         course = Course.objects.get(id=course_id)
-        sections = Section.objects.filter(course=course)
-        created_sections = sections.count()
+        # Load each section's students in one prefetch query instead of two queries per section
+        sections = list(
+            Section.objects.filter(course=course).select_related('period').prefetch_related(
+                Prefetch(
+                    'students',
+                    queryset=User.objects.only('id', 'first_name', 'last_name', 'grade_level')
+                )
+            )
+        )
+        distribution = [
+            {
+                'section_name': section.name,
+                'student_count': len(section.students.all()),
+                'period': section.period.name if section.period else None,
+                'students': [
+                    {
+                        'id': student.id,
+                        'first_name': student.first_name,
+                        'last_name': student.last_name,
+                        'grade_level': student.grade_level
+                    }
+                    for student in section.students.all()
+                ]
+            }
+            for section in sections
+        ]
         
         return {
             'success': True,
@@ -110,17 +135,9 @@ def get_course_distribution_status(course_id: int) -> Dict[str, any]:
             'course_code': course.code,
             'total_students': course.students.count(),
             'num_sections': course.num_sections,
-            'created_sections': created_sections,
-            'is_distributed': sections.filter(students__isnull=False).exists(),
-            'distribution': [
-                {
-                    'section_name': section.name,
-                    'student_count': section.students.count(),
-                    'period': section.period.name if section.period else None,
-                    'students': list(section.students.values('id', 'first_name', 'last_name', 'grade_level'))
-                }
-                for section in sections
-            ]
+            'created_sections': len(sections),
+            'is_distributed': any(entry['student_count'] for entry in distribution),
+            'distribution': distribution
         }
     except Course.DoesNotExist:
         return {'success': False, 'error': f'Course with id {course_id} not found'}
@@ -24,8 +24,11 @@ class SectionAdmin(TeacherFilterMixin, admin.ModelAdmin):
         })
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related().with_counts()
+
     def get_student_count(self, obj):
-        return obj.students.count()
+        return obj.get_student_count()
     get_student_count.short_description = 'Students'
     
     def get_course_duration(self, obj):
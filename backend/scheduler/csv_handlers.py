@@ -7,6 +7,52 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Roles accepted by the user CSV upload
+CSV_USER_ROLES = frozenset((UserRoles.STUDENT, UserRoles.TEACHER))
+
+# Rows per INSERT statement when saving validated uploads
+BULK_CREATE_BATCH_SIZE = 500
+
+# Uploads report at most this many row errors; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+class UploadErrors(list):
+    """Row errors and warnings collected while processing a CSV upload"""
+
+    def __init__(self, limit=MAX_REPORTED_ERRORS):
+        super().__init__()
+        self.limit = limit
+        self.suppressed = 0
+
+    def add(self, kind, line_num, message):
+        """
+        Record a message for a CSV row, or for the whole upload when line_num
+        is None, counting it once the limit is reached
+        """
+        if len(self) < self.limit:
+            where = f" on row {line_num}" if line_num is not None else ""
+            self.append(f"{kind}{where}: {message}")
+        else:
+            self.suppressed += 1
+
+    def summarize(self):
+        """Append a note about messages that were counted but not kept"""
+        if self.suppressed:
+            self.append(f"... and {self.suppressed} more errors not shown")
+            self.suppressed = 0
+
+# Pre-parsed grade levels so the common values skip int() on every row
+GRADE_LEVEL_VALUES = {str(i): i for i in range(0, 13)}
+
+def parse_grade_level(value):
+    """Parse a CSV grade level, returning None for blank values"""
+    if not value:
+        return None
+    grade_level = GRADE_LEVEL_VALUES.get(value)
+    if grade_level is None:
+        grade_level = int(value)
+    return grade_level
+
 def handle_user_csv(csv_file):
     """
     Handle CSV upload for users (students and teachers)
@@ -20,9 +66,16 @@ def handle_user_csv(csv_file):
     reader = csv.DictReader(io_string)
     
     created_count = 0
-    errors = []
+    errors = UploadErrors()
     
-    for row in reader:
+    # Read all rows up front so existing user IDs can be fetched in one query
+    rows = [(reader.line_num, row) for row in reader]
+    incoming_user_ids = [row['user_id'] for _, row in rows if row.get('user_id')]
+    existing_user_ids = set(
+        User.objects.filter(user_id__in=incoming_user_ids).values_list('user_id', flat=True)
+    )
+    
+    for line_num, row in rows:
         try:
             # Validate required fields
             required_fields = ['username', 'user_id', 'email']
@@ -30,13 +83,15 @@ def handle_user_csv(csv_file):
                 if not row.get(field):
                     raise ValueError(f"Missing required field: {field}")
 
-            # Check if user_id already exists
-            if User.objects.filter(user_id=row['user_id']).exists():
+            # Check if user_id already exists or was used earlier in this file
+            if row['user_id'] in existing_user_ids:
                 raise ValueError(f"User ID {row['user_id']} already exists")
 
             # Normalize and validate role
-            role = row.get('role', 'STUDENT').upper().strip()
-            if role not in [UserRoles.STUDENT, UserRoles.TEACHER]:
+            role = row.get('role', 'STUDENT')
+            if role not in CSV_USER_ROLES:
+                role = role.upper().strip()
+            if role not in CSV_USER_ROLES:
                 raise ValueError(f"Invalid role: {role}. Must be either 'student' or 'teacher' (case insensitive)")
 
             logger.debug(f"Processing user {row['username']} with role: {role}")
@@ -50,16 +105,18 @@ def handle_user_csv(csv_file):
                 first_name=row.get('first_name', ''),
                 last_name=row.get('last_name', ''),
                 role=role,
-                grade_level=int(row['grade_level']) if row.get('grade_level') else None,
+                grade_level=parse_grade_level(row.get('grade_level')),
                 gender=row.get('gender'),
                 password=make_password(password)
             )
             user.save()
+            existing_user_ids.add(user.user_id)
             logger.debug(f"Created user {user.username} with role: {user.role}")
             created_count += 1
         except Exception as e:
-            errors.append(f"Error on row {reader.line_num}: {str(e)}")
+            errors.add('Error', line_num, str(e))
     
+    errors.summarize()
     return created_count, errors
 
 def handle_course_csv(csv_file):
@@ -75,7 +132,7 @@ def handle_course_csv(csv_file):
     reader = csv.DictReader(io_string)
     
     created_count = 0
-    errors = []
+    errors = UploadErrors()
     
     for row in reader:
         try:
@@ -91,7 +148,7 @@ def handle_course_csv(csv_file):
             # Use specified course type or default based on duration
             course_type = row.get('course_type', default_type).upper()
             if course_type not in ['CORE', 'ELECTIVE']:
-                errors.append(f"Warning on row {reader.line_num}: Invalid course type '{course_type}' - defaulting to {default_type}")
+                errors.add('Warning', reader.line_num, f"Invalid course type '{course_type}' - defaulting to {default_type}")
                 course_type = default_type
             
             # Create course without teacher first
@@ -112,13 +169,14 @@ def handle_course_csv(csv_file):
                     teacher = User.objects.get(username=row['teacher_username'], role='TEACHER')
                     course.teacher = teacher
                 except User.DoesNotExist:
-                    errors.append(f"Warning on row {reader.line_num}: Teacher {row['teacher_username']} not found - course created without teacher")
+                    errors.add('Warning', reader.line_num, f"Teacher {row['teacher_username']} not found - course created without teacher")
             
             course.save()
             created_count += 1
         except Exception as e:
-            errors.append(f"Error on row {reader.line_num}: {str(e)}")
+            errors.add('Error', reader.line_num, str(e))
     
+    errors.summarize()
     return created_count, errors
 
 def handle_period_csv(csv_file):
@@ -132,7 +190,11 @@ def handle_period_csv(csv_file):
     reader = csv.DictReader(io_string)
     
     created_count = 0
-    errors = []
+    errors = UploadErrors()
+    periods = []
+    # Load saved periods once and check each row in memory instead of
+    # running full_clean()'s unique and overlap queries per row
+    existing_periods = list(Period.objects.only('id', 'name', 'start_time', 'end_time'))
     
     for row in reader:
         try:
@@ -141,11 +203,21 @@ def handle_period_csv(csv_file):
                 start_time=row['start_time'],
                 end_time=row['end_time']
             )
-            period.save()
-            created_count += 1
+            period.clean_fields()
+            period.validate_duration()
+            period.validate_against(existing_periods)
+            period.validate_against(periods)
+            periods.append(period)
         except Exception as e:
-            errors.append(f"Error on row {reader.line_num}: {str(e)}")
+            errors.add('Error', reader.line_num, str(e))
+    
+    try:
+        Period.objects.bulk_create(periods, batch_size=BULK_CREATE_BATCH_SIZE)
+        created_count = len(periods)
+    except Exception as e:
+        errors.add('Error saving periods', None, str(e))
     
+    errors.summarize()
     return created_count, errors
 
 def handle_room_csv(csv_file):
@@ -159,7 +231,9 @@ def handle_room_csv(csv_file):
     reader = csv.DictReader(io_string)
     
     created_count = 0
-    errors = []
+    errors = UploadErrors()
+    rooms = []
+    room_names = set()
     
     for row in reader:
         try:
@@ -168,11 +242,21 @@ def handle_room_csv(csv_file):
                 capacity=int(row['capacity']),
                 description=row['description']
             )
-            room.save()
-            created_count += 1
+            room.full_clean()
+            if room.name in room_names:
+                raise ValueError(f"Room {room.name} appears more than once in the file")
+            room_names.add(room.name)
+            rooms.append(room)
         except Exception as e:
-            errors.append(f"Error on row {reader.line_num}: {str(e)}")
+            errors.add('Error', reader.line_num, str(e))
+    
+    try:
+        Room.objects.bulk_create(rooms, batch_size=BULK_CREATE_BATCH_SIZE)
+        created_count = len(rooms)
+    except Exception as e:
+        errors.add('Error saving rooms', None, str(e))
     
+    errors.summarize()
     return created_count, errors
 
 def handle_section_csv(csv_file):
@@ -189,7 +273,8 @@ def handle_section_csv(csv_file):
     
     created_count = 0
     existing_count = 0
-    errors = []
+    errors = UploadErrors()
+    course_cache = {}
     
     def standardize_period_name(period_name):
         """Standardize period name to format: 1st Period"""
@@ -221,8 +306,14 @@ def handle_section_csv(csv_file):
     
     for row in reader:
         try:
-            # Get the course
-            course = Course.objects.get(code=row['course_code'])
+            # Get the course, reusing it for rows that share a course_code
+            course_code = row['course_code']
+            course = course_cache.get(course_code)
+            if course is None:
+                course = Course.objects.only(
+                    'id', 'name', 'code', 'num_sections', 'duration'
+                ).get(code=course_code)
+                course_cache[course_code] = course
             
             # Validate section number
             section_number = int(row['section_number'])
@@ -233,17 +324,17 @@ def handle_section_csv(csv_file):
             trimester = None
             if row.get('trimester'):
                 if course.duration != 'TRIMESTER':
-                    errors.append(f"Warning on row {reader.line_num}: Trimester specified for non-trimester course {course.code}")
+                    errors.add('Warning', reader.line_num, f"Trimester specified for non-trimester course {course.code}")
                 else:
                     try:
                         trimester = int(row['trimester'])
                         if trimester not in [1, 2, 3]:
                             raise ValueError("Trimester must be 1, 2, or 3")
                     except ValueError as e:
-                        errors.append(f"Error on row {reader.line_num}: Invalid trimester value - {str(e)}")
+                        errors.add('Error', reader.line_num, f"Invalid trimester value - {str(e)}")
                         continue
             elif course.duration == 'TRIMESTER':
-                errors.append(f"Error on row {reader.line_num}: No trimester specified for trimester course {course.code}")
+                errors.add('Error', reader.line_num, f"No trimester specified for trimester course {course.code}")
                 continue
             
             # Get teacher if provided
@@ -252,7 +343,7 @@ def handle_section_csv(csv_file):
                 try:
                     teacher = User.objects.get(username=row['teacher_username'], role='TEACHER')
                 except User.DoesNotExist:
-                    errors.append(f"Warning on row {reader.line_num}: Teacher {row['teacher_username']} not found")
+                    errors.add('Warning', reader.line_num, f"Teacher {row['teacher_username']} not found")
             
             # Get period if provided and standardize name
             period = None
@@ -262,7 +353,7 @@ def handle_section_csv(csv_file):
                     try:
                         period = Period.objects.get(name=standardized_period_name)
                     except Period.DoesNotExist:
-                        errors.append(f"Warning on row {reader.line_num}: Period {standardized_period_name} not found")
+                        errors.add('Warning', reader.line_num, f"Period {standardized_period_name} not found")
             
             # Get room if provided
             room = None
@@ -270,7 +361,7 @@ def handle_section_csv(csv_file):
                 try:
                     room = Room.objects.get(name=row['room_name'])
                 except Room.DoesNotExist:
-                    errors.append(f"Warning on row {reader.line_num}: Room {row['room_name']} not found")
+                    errors.add('Warning', reader.line_num, f"Room {row['room_name']} not found")
             
             # Get max_size if provided
             max_size = None
@@ -280,7 +371,7 @@ def handle_section_csv(csv_file):
                     if max_size <= 0:
                         raise ValueError("Max size must be positive")
                 except ValueError as e:
-                    errors.append(f"Warning on row {reader.line_num}: Invalid max_size value - {str(e)}")
+                    errors.add('Warning', reader.line_num, f"Invalid max_size value - {str(e)}")
                     max_size = None
             
             # Create or update section
@@ -299,7 +390,7 @@ def handle_section_csv(csv_file):
             # Update max_size if provided and valid
             if max_size is not None:
                 if section.students.count() > max_size:
-                    errors.append(f"Warning on row {reader.line_num}: Current student count ({section.students.count()}) exceeds specified max_size ({max_size})")
+                    errors.add('Warning', reader.line_num, f"Current student count ({section.students.count()}) exceeds specified max_size ({max_size})")
                 else:
                     section.max_students = max_size
                     section.save()
@@ -310,6 +401,7 @@ def handle_section_csv(csv_file):
                 existing_count += 1
             
         except Exception as e:
-            errors.append(f"Error on row {reader.line_num}: {str(e)}")
+            errors.add('Error', reader.line_num, str(e))
     
+    errors.summarize()
     return created_count, existing_count, errors
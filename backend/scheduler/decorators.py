@@ -1,5 +1,5 @@
 from functools import wraps
-from time import time
+from time import perf_counter_ns
 import logging
 from django.http import JsonResponse
 from django.core.exceptions import ValidationError
@@ -10,16 +10,17 @@ def log_execution_time(func):
     """Decorator to log execution time of view methods"""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time()
+        start_time = perf_counter_ns()
         result = func(*args, **kwargs)
-        execution_time = time() - start_time
-        logger.info(
-            f"{func.__name__} executed in {execution_time:.2f} seconds",
-            extra={
-                'execution_time': execution_time,
-                'view_method': func.__name__
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            execution_time_ms = (perf_counter_ns() - start_time) / 1e6
+            logger.info(
+                f"{func.__name__} executed in {execution_time_ms:.2f} ms",
+                extra={
+                    'execution_time_ms': execution_time_ms,
+                    'view_method': func.__name__
+                }
+            )
         return result
     return wrapper
 
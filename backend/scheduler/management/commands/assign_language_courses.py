@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import Count
 from scheduler.models import LanguageGroup, User, Section, Course
 import random
 
@@ -84,8 +85,11 @@ class Command(BaseCommand):
                 for course in courses:
                     total_enrolled = course.students.count()
                     sections_summary = []
-                    for section in course.sections.filter(period__in=language_group.periods.all()):
-                        sections_summary.append(f"Section {section.section_number}: {section.students.count()} students")
+                    summary_sections = course.sections.filter(
+                        period__in=language_group.periods.all()
+                    ).annotate(student_count=Count('students'))
+                    for section in summary_sections:
+                        sections_summary.append(f"Section {section.section_number}: {section.student_count} students")
                     self.stdout.write(
                         f'{course.name}: {total_enrolled} students total\n' +
                         '\n'.join(f'  {summary}' for summary in sections_summary)
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.20 on 2026-10-16 09:31
+
+from django.db import migrations, models
+
+
+def populate_duration_minutes(apps, schema_editor):
+    """Fill in the stored duration for existing periods"""
+    from datetime import date, datetime, timedelta
+
+    Period = apps.get_model('scheduler', 'Period')
+    today = date.today()
+    periods = list(Period.objects.all())
+    for period in periods:
+        start_dt = datetime.combine(today, period.start_time)
+        end_dt = datetime.combine(today, period.end_time)
+        if end_dt < start_dt:
+            end_dt += timedelta(days=1)
+        period.duration_minutes_cached = int((end_dt - start_dt).total_seconds() / 60)
+    Period.objects.bulk_update(periods, ['duration_minutes_cached'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0011_alter_course_course_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='period',
+            name='duration_minutes_cached',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Length of the period in minutes, computed from start and end time on validation'),
+        ),
+        migrations.RunPython(populate_duration_minutes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.20 on 2026-10-16 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0012_period_duration_minutes_cached'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='section',
+            index=models.Index(fields=['course', 'period'], name='section_course_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['semester', 'year', 'period'], name='schedule_term_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['course', 'semester', 'year'], name='schedule_course_term_idx'),
+        ),
+    ]
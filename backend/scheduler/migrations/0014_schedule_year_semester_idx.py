@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-16 10:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0013_section_schedule_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['year', 'semester'], name='schedule_year_semester_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-16 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0014_schedule_year_semester_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='studentpreference',
+            index=models.Index(fields=['student', 'preference_level'], name='preference_student_level_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentpreference',
+            index=models.Index(fields=['course', 'semester', 'year'], name='preference_course_term_idx'),
+        ),
+    ]
@@ -8,6 +8,11 @@ class BaseConfiguration(models.Model):
     class Meta:
         abstract = True
         
+    @classmethod
+    def get_active(cls):
+        """Get the active configuration of this type"""
+        return cls.objects.filter(active=True).first()
+        
     def save(self, *args, **kwargs):
         if self.active:
             # Deactivate all other configurations of the same type
@@ -15,4 +20,4 @@ class BaseConfiguration(models.Model):
         super().save(*args, **kwargs)
         
     def __str__(self):
-        return f"{self.name} ({'Active' if self.active else 'Inactive'})" 
\ No newline at end of file
+        return f"{self.name} ({'Active' if self.active else 'Inactive'})"
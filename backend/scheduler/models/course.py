@@ -1,12 +1,17 @@
 from __future__ import annotations
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Sequence
+from django.apps import apps
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Count, QuerySet
+from django.db.models import Count, F, Max, QuerySet, Value
+from django.db.models.functions import Greatest
 from .users import User
 from ..choices import CourseTypes, CourseDurations
 
+if TYPE_CHECKING:
+    from .section import Section
+
 class CourseGroup(models.Model):
     """Model for grouping mutually exclusive courses"""
     name = models.CharField(
@@ -23,13 +28,23 @@ class CourseGroup(models.Model):
 
     def clean(self) -> None:
         """Validate that the group has at least two courses"""
-        if self.pk and self.courses.count() < 2:
+        # Counting a two-row slice stops the scan as soon as the check passes
+        if self.pk and self.courses.all()[:2].count() < 2:
             raise ValidationError("A course group must contain at least two courses")
 
     class Meta:
         verbose_name = "Course Group"
         verbose_name_plural = "Course Groups"
 
+class LanguageGroupQuerySet(models.QuerySet):
+    """QuerySet for language groups with helpers for loading related data"""
+
+    def with_periods(self) -> LanguageGroupQuerySet:
+        """Prefetch the periods listed by __str__"""
+        return self.prefetch_related('periods')
+
+LanguageGroupManager = models.Manager.from_queryset(LanguageGroupQuerySet)
+
 class LanguageGroup(models.Model):
     """Model for grouping language courses across trimesters"""
     name = models.CharField(
@@ -50,6 +65,8 @@ class LanguageGroup(models.Model):
         help_text="Language courses in this group"
     )
 
+    objects = LanguageGroupManager()
+
     class Meta:
         verbose_name = "Language Group"
         verbose_name_plural = "Language Groups"
@@ -62,14 +79,19 @@ class LanguageGroup(models.Model):
         """Validate that all courses are language courses and sections are in the correct periods"""
         super().clean()
         if self.pk:  # Only validate if the object exists
-            for course in self.courses.all():
-                if course.course_type != CourseTypes.LANGUAGE:
-                    raise ValidationError(f"{course.name} must be a LANGUAGE type course")
-                if course.grade_level != self.grade_level:
-                    raise ValidationError(f"{course.name} must be for grade level {self.grade_level}")
-                # Check that all sections are in one of the allowed periods
-                if course.sections.exclude(period__in=self.periods.all()).exists():
-                    raise ValidationError(f"All sections of {course.name} must be in one of the selected periods")
+            for name, course_type, grade_level in self.courses.values_list('name', 'course_type', 'grade_level'):
+                if course_type != CourseTypes.LANGUAGE:
+                    raise ValidationError(f"{name} must be a LANGUAGE type course")
+                if grade_level != self.grade_level:
+                    raise ValidationError(f"{name} must be for grade level {self.grade_level}")
+            # Check that all sections are in one of the allowed periods
+            misplaced_course = apps.get_model('scheduler', 'Section').objects.filter(
+                course__in=self.courses.all()
+            ).exclude(
+                period__in=self.periods.all()
+            ).values_list('course__name', flat=True).first()
+            if misplaced_course:
+                raise ValidationError(f"All sections of {misplaced_course} must be in one of the selected periods")
 
 class StudentCountRequirementTypes:
     EXACT = 'EXACT'
@@ -84,6 +106,61 @@ class StudentCountRequirementTypes:
         (FULL_GRADE, 'Full Grade (Default)'),
     )
 
+# Columns read when listing courses (names, codes and filters), without the description
+COURSE_LISTING_FIELDS = ('id', 'name', 'code', 'grade_level', 'course_type', 'duration')
+
+class CourseQuerySet(models.QuerySet):
+    """QuerySet for courses with helpers for loading related data"""
+
+    def with_stats(self) -> CourseQuerySet:
+        """Prefetch registered students and sections with their students"""
+        return self.prefetch_related('students', 'sections__students')
+
+    def for_scheduler(self) -> CourseQuerySet:
+        """Load only the columns the scheduler reads, skipping the description"""
+        return self.only(
+            'id', 'name', 'code', 'num_sections', 'max_students_per_section',
+            'grade_level', 'duration', 'course_type'
+        )
+
+    def for_listing(self, fields: Optional[Sequence[str]] = None) -> CourseQuerySet:
+        """Load only the columns needed to list courses, or the given fields"""
+        return self.only(*(fields or COURSE_LISTING_FIELDS))
+
+    def with_counts(self) -> CourseQuerySet:
+        """Annotate each course with its registered student and section counts"""
+        return self.annotate(
+            students_count=Count('students', distinct=True),
+            sections_count=Count('sections', distinct=True)
+        )
+
+    def with_capacity(self) -> CourseQuerySet:
+        """Annotate each course with its total seat count and the seats still open"""
+        return self.annotate(
+            total_capacity=F('num_sections') * F('max_students_per_section')
+        ).annotate(
+            available_space=Greatest(F('total_capacity') - Count('students', distinct=True), Value(0))
+        )
+
+    def bulk_create_validated(self, courses: List[Course], batch_size: int = 500) -> List[Course]:
+        """
+        Validate new courses in Python, checking their codes against the
+        database with one query, then insert them with bulk_create.
+        Course.clean() checks the same ranges as the check constraints, so
+        validate_constraints() and its query per constraint per row are skipped.
+        """
+        codes = [course.code for course in courses if course.code]
+        taken_codes = set(self.filter(code__in=codes).values_list('code', flat=True))
+        for course in courses:
+            course.full_clean(validate_unique=False, validate_constraints=False)
+            if course.code:
+                if course.code in taken_codes:
+                    raise ValidationError({'code': f"Course with code {course.code} already exists"})
+                taken_codes.add(course.code)
+        return self.bulk_create(courses, batch_size=batch_size)
+
+CourseManager = models.Manager.from_queryset(CourseQuerySet)
+
 class Course(models.Model):
     """Model for academic courses"""
     name: str = models.CharField(
@@ -159,6 +236,8 @@ class Course(models.Model):
         help_text="Group of mutually exclusive courses this course belongs to"
     )
 
+    objects = CourseManager()
+
     class Meta:
         ordering = ['grade_level', 'name']
         indexes = [
@@ -214,18 +293,27 @@ class Course(models.Model):
         
         # Validate that a student isn't enrolled in mutually exclusive courses
         if self.exclusivity_group and self.pk:
-            from django.db.models import Q
             exclusive_courses = self.exclusivity_group.courses.exclude(pk=self.pk)
-            for student in self.students.all():
-                if exclusive_courses.filter(students=student).exists():
-                    raise ValidationError(
-                        f"Student {student} cannot be enrolled in {self.name} as they are already "
-                        f"enrolled in another course from the {self.exclusivity_group.name} group"
-                    )
+            conflicting_students = User.objects.filter(
+                pk__in=self.students.values('pk'),
+                registered_courses__in=exclusive_courses
+            ).distinct()
+            if conflicting_students:
+                student_list = ", ".join(str(student) for student in conflicting_students)
+                raise ValidationError(
+                    f"Students {student_list} cannot be enrolled in {self.name} as they are already "
+                    f"enrolled in another course from the {self.exclusivity_group.name} group"
+                )
     
-    def save(self, *args: Any, **kwargs: Any) -> None:
-        """Save the course instance"""
-        self.full_clean()
+    def save(self, *args: Any, validate: bool = True, **kwargs: Any) -> None:
+        """
+        Save the course instance.
+        Pass validate=False from trusted batch code to skip full_clean(); the
+        check constraints still guard grade level, capacity and section count,
+        but the code format is only checked by clean().
+        """
+        if validate:
+            self.full_clean()
         super().save(*args, **kwargs)
     
     def is_elective(self) -> bool:
@@ -238,45 +326,70 @@ class Course(models.Model):
 
     def get_next_section_number(self) -> int:
         """Get the next available section number for this course"""
-        existing_sections = self.sections.order_by('-section_number')
-        if not existing_sections.exists():
+        max_section_number = self.sections.aggregate(
+            max_section_number=Max('section_number')
+        )['max_section_number']
+        if max_section_number is None:
             return 1
-        return existing_sections.first().section_number + 1
+        return max_section_number + 1
+    
+    def create_sections(self) -> List[Section]:
+        """
+        Create any missing sections numbered 1 to num_sections with a single
+        bulk insert, and return all sections of the course
+        """
+        section_model = self.sections.model
+        existing_numbers = set(self.sections.values_list('section_number', flat=True))
+        name_prefix = self.code or self.name
+        section_model.objects.bulk_create(
+            [
+                section_model(course=self, section_number=number, name=f"{name_prefix}-{number}")
+                for number in range(1, self.num_sections + 1)
+                if number not in existing_numbers
+            ],
+            batch_size=500,
+            ignore_conflicts=True
+        )
+        return list(self.sections.all())
     
     def get_total_capacity(self) -> int:
         """Get the total student capacity across all sections"""
         return self.num_sections * self.max_students_per_section
     
+    def get_student_count(self) -> int:
+        """Get the number of registered students, preferring an annotated count"""
+        students_count = getattr(self, 'students_count', None)
+        if students_count is None:
+            return self.students.count()
+        return students_count
+    
     def has_space_for_students(self, count: int = 1) -> bool:
         """Check if there's space for more students"""
-        return self.students.count() + count <= self.get_total_capacity()
+        return self.get_student_count() + count <= self.get_total_capacity()
     
     def get_available_space(self) -> int:
         """Get number of available spots in the course"""
-        return max(0, self.get_total_capacity() - self.students.count())
+        return max(0, self.get_total_capacity() - self.get_student_count())
     
     def get_section_stats(self) -> Dict[str, int]:
         """Get statistics about sections"""
-        stats = self.sections.aggregate(
-            total_students=Count('students'),
-            total_sections=Count('id')
-        )
+        stats = self.sections.enrollment_totals()
         stats['available_sections'] = self.num_sections - stats['total_sections']
         stats['total_capacity'] = self.get_total_capacity()
         stats['available_space'] = self.get_available_space()
         return stats
     
     @classmethod
-    def get_courses_by_grade(cls, grade_level: int) -> QuerySet[Course]:
-        """Get all courses for a specific grade level"""
-        return cls.objects.filter(grade_level=grade_level).order_by('name')
+    def get_courses_by_grade(cls, grade_level: int, fields: Optional[Sequence[str]] = None) -> QuerySet[Course]:
+        """Get all courses for a specific grade level, loading only the listing fields"""
+        return cls.objects.for_listing(fields).filter(grade_level=grade_level).order_by('name')
     
     @classmethod
-    def get_courses_by_type(cls, course_type: str) -> QuerySet[Course]:
-        """Get all courses of a specific type"""
-        return cls.objects.filter(course_type=course_type).order_by('grade_level', 'name')
+    def get_courses_by_type(cls, course_type: str, fields: Optional[Sequence[str]] = None) -> QuerySet[Course]:
+        """Get all courses of a specific type, loading only the listing fields"""
+        return cls.objects.for_listing(fields).filter(course_type=course_type).order_by('grade_level', 'name')
     
     @classmethod
-    def get_courses_by_duration(cls, duration: str) -> QuerySet[Course]:
-        """Get all courses of a specific duration"""
-        return cls.objects.filter(duration=duration).order_by('grade_level', 'name') 
\ No newline at end of file
+    def get_courses_by_duration(cls, duration: str, fields: Optional[Sequence[str]] = None) -> QuerySet[Course]:
+        """Get all courses of a specific duration, loading only the listing fields"""
+        return cls.objects.for_listing(fields).filter(duration=duration).order_by('grade_level', 'name')
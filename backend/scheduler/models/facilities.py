@@ -3,9 +3,20 @@ from typing import Dict, Any, List, Optional
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Count, QuerySet
+from django.db.models import Count, Exists, Max, OuterRef, QuerySet
 from .section import Section
 
+class RoomQuerySet(models.QuerySet):
+    """QuerySet for rooms with helpers for checking period availability"""
+
+    def with_conflict_flags(self, period_id: int) -> RoomQuerySet:
+        """Annotate each room with whether it already has a section in the period"""
+        return self.annotate(
+            has_conflict=Exists(Section.objects.filter(room=OuterRef('pk'), period_id=period_id))
+        )
+
+RoomManager = models.Manager.from_queryset(RoomQuerySet)
+
 class Room(models.Model):
     """Physical classrooms"""
     name = models.CharField(
@@ -37,6 +48,8 @@ class Room(models.Model):
         db_index=True,
         help_text="Whether this room is a gymnasium or physical education space"
     )
+
+    objects = RoomManager()
     
     class Meta:
         ordering = ['name']
@@ -68,40 +81,47 @@ class Room(models.Model):
         """Validate room data"""
         super().clean()
         
-        # Check if capacity is sufficient for current sections
+        # Check if capacity is sufficient for current sections (a new room has none)
+        if not self.pk:
+            return
         max_section_size = self.sections.annotate(
             student_count=Count('students')
-        ).order_by('-student_count').values_list('student_count', flat=True).first()
+        ).aggregate(max_section_size=Max('student_count'))['max_section_size']
         
         if max_section_size and self.capacity < max_section_size:
             raise ValidationError({
                 'capacity': f'Capacity must be at least {max_section_size} to accommodate current sections'
             })
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
-        """Save the room instance"""
-        self.full_clean()
+    def save(self, *args: Any, validate: bool = True, **kwargs: Any) -> None:
+        """
+        Save the room instance.
+        Pass validate=False from trusted batch code to skip full_clean(); the
+        capacity check constraint still guards the basic invariant.
+        """
+        if validate:
+            self.full_clean()
         super().save(*args, **kwargs)
 
     def is_at_capacity(self, period_id: Optional[int] = None) -> bool:
         """Check if room is at capacity for a given period"""
         if period_id:
-            section = self.sections.filter(period_id=period_id).first()
+            section = self.sections.select_related('course').with_counts().filter(period_id=period_id).first()
             return section.is_at_capacity() if section else False
         return False
 
     def get_available_space(self, period_id: Optional[int] = None) -> int:
         """Get number of available spots in the room for a given period"""
         if period_id:
-            section = self.sections.filter(period_id=period_id).first()
+            section = self.sections.select_related('course').with_counts().filter(period_id=period_id).first()
             return section.get_available_space() if section else self.capacity
         return self.capacity
 
     def get_schedule_stats(self) -> Dict[str, Any]:
         """Get statistics about room scheduling"""
-        sections = self.sections.all()
-        total_sections = sections.count()
-        total_students = sum(section.students.count() for section in sections)
+        stats = self.sections.enrollment_totals()
+        total_sections = stats['total_sections']
+        total_students = stats['total_students']
         
         return {
             'total_sections': total_sections,
@@ -121,11 +141,9 @@ class Room(models.Model):
     @classmethod
     def get_available_rooms(cls, period_id: int, min_capacity: int = 1) -> QuerySet[Room]:
         """Get all rooms available for a specific period with minimum capacity"""
-        scheduled_rooms = Section.objects.filter(period_id=period_id).values_list('room_id', flat=True)
-        return cls.objects.filter(
-            capacity__gte=min_capacity
-        ).exclude(
-            id__in=scheduled_rooms
+        return cls.objects.with_conflict_flags(period_id).filter(
+            capacity__gte=min_capacity,
+            has_conflict=False
         ).order_by('name')
 
     @classmethod
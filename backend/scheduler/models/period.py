@@ -3,8 +3,29 @@ from typing import Dict, Any, List, Optional
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Count, QuerySet
+from django.db.models import Count, Exists, OuterRef, QuerySet
 from datetime import datetime, date, timedelta
+from .users import User
+from .section import Section
+from .facilities import Room
+
+class PeriodQuerySet(models.QuerySet):
+    """QuerySet for periods with helpers for checking teacher and room availability"""
+
+    def with_conflict_flags(self, teacher_id: Optional[int] = None, room_id: Optional[int] = None) -> PeriodQuerySet:
+        """Annotate each period with whether the teacher or room already has a section in it"""
+        flags = {}
+        if teacher_id is not None:
+            flags['teacher_conflict'] = Exists(
+                Section.objects.filter(period=OuterRef('pk'), teacher_id=teacher_id)
+            )
+        if room_id is not None:
+            flags['room_conflict'] = Exists(
+                Section.objects.filter(period=OuterRef('pk'), room_id=room_id)
+            )
+        return self.annotate(**flags)
+
+PeriodManager = models.Manager.from_queryset(PeriodQuerySet)
 
 class Period(models.Model):
     """Class periods in the school day"""
@@ -22,6 +43,13 @@ class Period(models.Model):
         db_index=True,
         help_text="End time of the period"
     )
+    duration_minutes_cached = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Length of the period in minutes, computed from start and end time on validation"
+    )
+
+    objects = PeriodManager()
     
     class Meta:
         ordering = ['start_time']
@@ -38,22 +66,7 @@ class Period(models.Model):
     def clean(self) -> None:
         """Validate period data"""
         super().clean()
-        
-        # Convert TimeField to datetime for comparison
-        today = date.today()
-        start_dt = datetime.combine(today, self.start_time)
-        end_dt = datetime.combine(today, self.end_time)
-        
-        # Handle periods that cross midnight
-        if end_dt < start_dt:
-            end_dt += timedelta(days=1)
-        
-        # Validate minimum duration (e.g., 30 minutes)
-        duration = end_dt - start_dt
-        if duration.total_seconds() < 1800:  # 30 minutes
-            raise ValidationError({
-                'end_time': 'Period must be at least 30 minutes long'
-            })
+        self.validate_duration()
         
         # Check for overlapping periods
         overlapping = Period.objects.exclude(id=self.id).filter(
@@ -63,13 +76,50 @@ class Period(models.Model):
         if overlapping.exists():
             raise ValidationError('This period overlaps with another period')
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
-        """Save the period instance"""
-        self.full_clean()
+    def validate_duration(self) -> None:
+        """Store the duration and check the period is long enough, without querying"""
+        self.duration_minutes_cached = self.calculate_duration_minutes()
+        
+        # Validate minimum duration (e.g., 30 minutes)
+        if self.duration_minutes_cached < 30:
+            raise ValidationError({
+                'end_time': 'Period must be at least 30 minutes long'
+            })
+
+    def validate_against(self, periods: List[Period]) -> None:
+        """Check name uniqueness and overlap against already loaded periods without querying"""
+        for other in periods:
+            if other.pk is not None and other.pk == self.pk:
+                continue
+            if other.name == self.name:
+                raise ValidationError({'name': f"Period {self.name} already exists"})
+            if other.start_time < self.end_time and other.end_time > self.start_time:
+                raise ValidationError(f"Period {self.name} overlaps with period {other.name}")
+
+    def save(self, *args: Any, validate: bool = True, **kwargs: Any) -> None:
+        """
+        Save the period instance.
+        Pass validate=False from callers that have already validated the
+        period.
+        """
+        if validate:
+            self.full_clean()
+        # Recompute the stored duration on every save, validated or not
+        self.duration_minutes_cached = self.calculate_duration_minutes()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'duration_minutes_cached' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'duration_minutes_cached']
         super().save(*args, **kwargs)
 
     def duration_minutes(self) -> int:
-        """Calculate the duration of the period in minutes"""
+        """Get the duration of the period in minutes, as stored by save() and clean()"""
+        if self.duration_minutes_cached:
+            return self.duration_minutes_cached
+        # Rows inserted without validation have no stored duration yet
+        return self.calculate_duration_minutes()
+
+    def calculate_duration_minutes(self) -> int:
+        """Calculate the duration of the period in minutes from its times"""
         today = date.today()
         start_dt = datetime.combine(today, self.start_time)
         end_dt = datetime.combine(today, self.end_time)
@@ -83,17 +133,26 @@ class Period(models.Model):
 
     def get_schedule_stats(self) -> Dict[str, Any]:
         """Get statistics about period scheduling"""
-        sections = self.sections.all()
-        total_sections = sections.count()
-        total_students = sum(section.students.count() for section in sections)
+        # One grouped query gives the section and student counts per course type
+        type_stats = self.sections.order_by().values('course__course_type').annotate(
+            section_count=Count('id', distinct=True),
+            student_count=Count('students')
+        )
+        total_sections = 0
+        total_students = 0
+        type_counts = {}
+        for row in type_stats:
+            total_sections += row['section_count']
+            total_students += row['student_count']
+            type_counts[row['course__course_type']] = row['section_count']
         
         return {
             'total_sections': total_sections,
             'total_students': total_students,
             'duration_minutes': self.duration_minutes(),
             'sections_by_type': {
-                'core': sections.filter(course__course_type='CORE').count(),
-                'elective': sections.filter(course__course_type='ELECTIVE').count()
+                'core': type_counts.get('CORE', 0),
+                'elective': type_counts.get('ELECTIVE', 0)
             }
         }
 
@@ -107,22 +166,16 @@ class Period(models.Model):
 
     def get_available_rooms(self, min_capacity: int = 1) -> QuerySet[Room]:
         """Get all rooms available for this period with minimum capacity"""
-        from .facilities import Room
-        scheduled_rooms = self.sections.values_list('room_id', flat=True)
-        return Room.objects.filter(
-            capacity__gte=min_capacity
-        ).exclude(
-            id__in=scheduled_rooms
+        return Room.objects.with_conflict_flags(self.pk).filter(
+            capacity__gte=min_capacity,
+            has_conflict=False
         ).order_by('name')
 
     def get_available_teachers(self) -> QuerySet[User]:
         """Get all teachers available for this period"""
-        from .users import User
-        scheduled_teachers = self.sections.values_list('teacher_id', flat=True)
         return User.objects.filter(
+            ~Exists(Section.objects.filter(teacher=OuterRef('pk'), period=self)),
             role='TEACHER'
-        ).exclude(
-            id__in=scheduled_teachers
         ).order_by('last_name', 'first_name')
 
     @classmethod
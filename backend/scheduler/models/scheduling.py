@@ -6,6 +6,15 @@ from .facilities import Room
 from .configuration import SchedulingConfiguration
 from ..choices import PreferenceLevels
 
+class ScheduleQuerySet(models.QuerySet):
+    """QuerySet for schedules with helpers for loading related data"""
+
+    def with_related(self):
+        """Join the course, period and room of each schedule"""
+        return self.select_related('course', 'period', 'room')
+
+ScheduleManager = models.Manager.from_queryset(ScheduleQuerySet)
+
 class Schedule(models.Model):
     """Class schedule assignments"""
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
@@ -25,8 +34,15 @@ class Schedule(models.Model):
         blank=True,
         help_text="Configuration settings used for this schedule"
     )
+
+    objects = ScheduleManager()
     
     class Meta:
+        indexes = [
+            models.Index(fields=['semester', 'year', 'period'], name='schedule_term_period_idx'),
+            models.Index(fields=['course', 'semester', 'year'], name='schedule_course_term_idx'),
+            models.Index(fields=['year', 'semester'], name='schedule_year_semester_idx'),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['room', 'period', 'semester', 'year'],
@@ -42,9 +58,19 @@ class Schedule(models.Model):
         return f"{self.course.name} - {self.period.name} ({self.room.name})"
     
     def is_at_capacity(self):
-        max_size = self.configuration.max_class_size if self.configuration else self.course.max_students
+        """Check if the schedule is full"""
+        max_size = self.configuration.max_class_size if self.configuration_id else self.course.max_students_per_section
         return self.students.count() >= max_size
 
+class StudentPreferenceQuerySet(models.QuerySet):
+    """QuerySet for student preferences with helpers for loading related data"""
+
+    def with_related(self):
+        """Join the student and course of each preference"""
+        return self.select_related('student', 'course')
+
+StudentPreferenceManager = models.Manager.from_queryset(StudentPreferenceQuerySet)
+
 class StudentPreference(models.Model):
     """Student course preferences for scheduling"""
     student = models.ForeignKey(
@@ -58,10 +84,16 @@ class StudentPreference(models.Model):
     )
     semester = models.CharField(max_length=20)
     year = models.IntegerField()
+
+    objects = StudentPreferenceManager()
     
     class Meta:
         unique_together = ['student', 'course', 'semester', 'year']
         ordering = ['student', 'preference_level']
+        indexes = [
+            models.Index(fields=['student', 'preference_level'], name='preference_student_level_idx'),
+            models.Index(fields=['course', 'semester', 'year'], name='preference_course_term_idx'),
+        ]
         
     def __str__(self):
         return f"{self.student.username} - {self.course.name} (Preference: {self.preference_level})" 
\ No newline at end of file
@@ -3,11 +3,33 @@ from typing import Dict, Optional, Any, List
 from django.db import models
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
-from django.db.models import Count, QuerySet
+from django.db.models import Count, Q, QuerySet
 from .users import User
 from .course import Course
 from ..choices import TrimesterChoices
 
+class SectionQuerySet(models.QuerySet):
+    """QuerySet for sections with helpers for loading related data"""
+
+    def with_related(self) -> SectionQuerySet:
+        """Join the course, teacher, period and room of each section"""
+        return self.select_related('course', 'teacher', 'period', 'room').defer(
+            'course__description', 'room__description'
+        )
+
+    def with_counts(self) -> SectionQuerySet:
+        """Annotate each section with its enrolled student count"""
+        return self.annotate(enrolled_count=Count('students'))
+
+    def enrollment_totals(self) -> Dict[str, int]:
+        """Get the total enrolled students and number of sections in one query"""
+        return self.aggregate(
+            total_students=Count('students'),
+            total_sections=Count('id', distinct=True)
+        )
+
+SectionManager = models.Manager.from_queryset(SectionQuerySet)
+
 class Section(models.Model):
     """Model for course sections"""
     course: Course = models.ForeignKey(
@@ -76,6 +98,8 @@ class Section(models.Model):
         help_text="Students assigned to this section by the scheduler"
     )
 
+    objects = SectionManager()
+
     class Meta:
         unique_together = [['course', 'section_number']]
         ordering = ['course', 'section_number']
@@ -83,6 +107,7 @@ class Section(models.Model):
             models.Index(fields=['course', 'section_number']),
             models.Index(fields=['teacher', 'period']),
             models.Index(fields=['room', 'period']),
+            models.Index(fields=['course', 'period'], name='section_course_period_idx'),
         ]
         verbose_name = "Section"
         verbose_name_plural = "Sections"
@@ -120,96 +145,93 @@ class Section(models.Model):
             })
         
         # Validate room capacity if room is assigned
-        if self.room and self.students.count() > self.room.capacity:
-            raise ValidationError({
-                'room': f'Room capacity ({self.room.capacity}) is less than student count ({self.students.count()})'
-            })
+        if self.room:
+            student_count = self.students.count() if self.pk else 0
+            if student_count > self.room.capacity:
+                raise ValidationError({
+                    'room': f'Room capacity ({self.room.capacity}) is less than student count ({student_count})'
+                })
         
-        # Validate teacher schedule conflicts
-        if self.teacher and self.period:
-            conflicts = Section.objects.filter(
-                teacher=self.teacher,
-                period=self.period
-            ).exclude(id=self.id)
-            if conflicts.exists():
+        # Validate teacher and room schedule conflicts with one query
+        if self.period_id and (self.teacher_id or self.room_id):
+            conflicts = list(
+                self._schedule_conflicts(self.period_id).values_list('teacher_id', 'room_id')
+            )
+            if self.teacher_id and any(teacher_id == self.teacher_id for teacher_id, _ in conflicts):
                 raise ValidationError({
                     'teacher': f'Teacher {self.teacher} is already scheduled for period {self.period}'
                 })
-        
-        # Validate room schedule conflicts
-        if self.room and self.period:
-            conflicts = Section.objects.filter(
-                room=self.room,
-                period=self.period
-            ).exclude(id=self.id)
-            if conflicts.exists():
+            if self.room_id and any(room_id == self.room_id for _, room_id in conflicts):
                 raise ValidationError({
                     'room': f'Room {self.room} is already scheduled for period {self.period}'
                 })
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
-        """Save the section instance"""
+    def save(self, *args: Any, validate: bool = True, **kwargs: Any) -> None:
+        """
+        Save the section instance.
+        Pass validate=False from scheduler code whose writes are already known
+        to be valid, to skip the queries run by full_clean().
+        """
         # Generate section name if not provided
         if not self.name and self.course and self.section_number:
             self.name = f"{self.course.code or self.course.name}-{self.section_number}"
         
-        self.full_clean()
+        if validate:
+            self.full_clean()
         super().save(*args, **kwargs)
 
+    def get_student_count(self) -> int:
+        """Get the number of enrolled students, preferring an annotated count"""
+        enrolled_count = getattr(self, 'enrolled_count', None)
+        if enrolled_count is None:
+            return self.students.count()
+        return enrolled_count
+
     def is_at_capacity(self) -> bool:
         """Check if section is at maximum capacity"""
-        return self.students.count() >= self.course.max_students_per_section
+        return self.get_student_count() >= self.course.max_students_per_section
 
     def get_available_space(self) -> int:
         """Get number of available spots in the section"""
-        return max(0, self.course.max_students_per_section - self.students.count())
+        return max(0, self.course.max_students_per_section - self.get_student_count())
 
     def get_student_stats(self) -> Dict[str, Any]:
-        """Get statistics about students in the section"""
-        student_count = self.students.count()
+        """Get statistics about students in the section, counting them once"""
+        student_count = self.get_student_count()
+        max_students = self.course.max_students_per_section
         return {
             'total_students': student_count,
-            'available_space': self.get_available_space(),
-            'at_capacity': self.is_at_capacity(),
-            'capacity_percentage': round((student_count / self.course.max_students_per_section) * 100, 1)
+            'available_space': max(0, max_students - student_count),
+            'at_capacity': student_count >= max_students,
+            'capacity_percentage': round((student_count / max_students) * 100, 1)
         }
     
+    def _schedule_conflicts(self, period_id: int) -> QuerySet[Section]:
+        """Other sections in the period that share this section's teacher or room"""
+        clash = Q()
+        if self.teacher_id:
+            clash |= Q(teacher_id=self.teacher_id)
+        if self.room_id:
+            clash |= Q(room_id=self.room_id)
+        return Section.objects.filter(clash, period_id=period_id).exclude(id=self.id)
+    
     def has_schedule_conflict(self, period_id: int) -> bool:
         """Check if moving to a new period would create conflicts"""
-        if not period_id:
+        if not period_id or not (self.teacher_id or self.room_id):
             return False
-            
-        # Check teacher conflicts
-        if self.teacher:
-            teacher_conflicts = Section.objects.filter(
-                teacher=self.teacher,
-                period_id=period_id
-            ).exclude(id=self.id).exists()
-            if teacher_conflicts:
-                return True
-        
-        # Check room conflicts
-        if self.room:
-            room_conflicts = Section.objects.filter(
-                room=self.room,
-                period_id=period_id
-            ).exclude(id=self.id).exists()
-            if room_conflicts:
-                return True
-        
-        return False
+        return self._schedule_conflicts(period_id).exists()
+    
+    def _conflicting_students(self, period_id: int) -> QuerySet[User]:
+        """Students of this section who already have another section in the period"""
+        return self.students.filter(
+            assigned_sections__in=Section.objects.filter(period_id=period_id).exclude(id=self.id)
+        ).distinct()
     
     def get_student_conflicts(self, period_id: int) -> List[int]:
         """Get IDs of students who would have conflicts in the new period"""
         if not period_id:
             return []
-            
-        conflicting_students = []
-        for student in self.students.all():
-            if student.assigned_sections.filter(period_id=period_id).exists():
-                conflicting_students.append(student.id)
-        
-        return conflicting_students
+        return list(self._conflicting_students(period_id).values_list('id', flat=True))
     
     @classmethod
     def get_sections_by_teacher(cls, teacher_id: int) -> QuerySet[Section]:
@@ -224,4 +246,4 @@ class Section(models.Model):
     @classmethod
     def get_sections_by_room(cls, room_id: int) -> QuerySet[Section]:
         """Get all sections scheduled in a specific room"""
-        return cls.objects.filter(room_id=room_id).select_related('course', 'teacher', 'period') 
\ No newline at end of file
+        return cls.objects.filter(room_id=room_id).select_related('course', 'teacher', 'period')
@@ -13,62 +13,60 @@ def distribute_pe6_students() -> Dict[str, any]:
     """
     try:
         # Get PE6 course
-        pe6_course = Course.objects.filter(code='PE6').first()
+        pe6_course = Course.objects.for_scheduler().filter(code='PE6').first()
         if not pe6_course:
             return {'success': False, 'error': 'PE6 course not found'}
 
-        # Get all registered students for PE6
-        registered_students = list(pe6_course.students.all())
+        # Get the IDs of all registered students for PE6, most heavily registered
+        # first, so dealing them out round-robin spreads the students with the
+        # most other courses (and so the most potential conflicts) across sections
+        registered_students = list(
+            User.objects.filter(
+                id__in=pe6_course.students.values('id')
+            ).annotate(
+                course_count=Count('registered_courses')
+            ).order_by('-course_count', 'id').values_list('id', flat=True)
+        )
         if not registered_students:
             return {'success': False, 'error': 'No students registered for PE6'}
 
         # Get or create sections for PE6
         sections = list(Section.objects.filter(course=pe6_course))
         if not sections:
-            # Create sections if they don't exist
-            sections = []
-            for i in range(pe6_course.num_sections):
-                section = Section.objects.create(
-                    course=pe6_course,
-                    section_number=i + 1,
-                    name=f"PE6-{i + 1}"
-                )
-                sections.append(section)
-
-        # Calculate even distribution
-        students_per_section = len(registered_students) // len(sections)
-        remaining_students = len(registered_students) % len(sections)
+            # Create sections PE6-1..PE6-n with a single bulk insert
+            sections = pe6_course.create_sections()
 
-        # Distribute students across sections
+        # Distribute students across sections, writing the enrollment rows directly
+        SectionStudent = Section.students.through
         with transaction.atomic():
             # Clear existing assignments first
-            for section in sections:
-                section.students.clear()
+            SectionStudent.objects.filter(section_id__in=[section.id for section in sections]).delete()
 
-            student_index = 0
+            assignments = []
+            distribution = []
+            num_sections = len(sections)
             for i, section in enumerate(sections):
-                # Calculate how many students this section should get
-                section_size = students_per_section + (1 if i < remaining_students else 0)
-                
-                # Assign students to this section
-                section_students = registered_students[student_index:student_index + section_size]
-                section.students.add(*section_students)
-                student_index += section_size
+                # Deal students out round-robin; section sizes differ by at most one
+                section_students = registered_students[i::num_sections]
+                assignments.extend(
+                    SectionStudent(section_id=section.id, user_id=student_id)
+                    for student_id in section_students
+                )
+                distribution.append({
+                    'section_name': section.name,
+                    'student_count': len(section_students)
+                })
 
                 logger.info(f"Assigned {len(section_students)} students to section {section.name}")
 
+            SectionStudent.objects.bulk_create(assignments, batch_size=1000)
+
         # Return distribution results
         results = {
             'success': True,
             'total_students': len(registered_students),
             'num_sections': len(sections),
-            'distribution': [
-                {
-                    'section_name': section.name,
-                    'student_count': section.students.count()
-                }
-                for section in sections
-            ]
+            'distribution': distribution
         }
 
         return results
@@ -1,13 +1,34 @@
 from typing import List, Dict, Optional, Union, Any
 from django.db import transaction
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, Prefetch, Q, Sum
 from ..models import Course, Section, User, Period, LanguageGroup
+import heapq
 import logging
 import random
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+def get_student_assignments_bulk(student_ids: List[int]) -> Dict[int, Dict[int, int]]:
+    """
+    Get all current period assignments for several students in one query.
+    
+    Args:
+        student_ids: The IDs of the students
+    
+    Returns:
+        Dictionary mapping student_ids to {period_id: course_id}; students
+        without assignments are left out
+    """
+    assignments = defaultdict(dict)
+    rows = Section.students.through.objects.filter(
+        user_id__in=student_ids,
+        section__period_id__isnull=False
+    ).values_list('user_id', 'section__period_id', 'section__course_id')
+    for student_id, period_id, course_id in rows:
+        assignments[student_id][period_id] = course_id
+    return assignments
+
 def get_student_assignments(student_id: int) -> Dict[int, int]:
     """
     Get all current period assignments for a student from the database.
@@ -18,12 +39,7 @@ def get_student_assignments(student_id: int) -> Dict[int, int]:
     Returns:
         Dictionary mapping period_ids to course_ids
     """
-    assignments = {}
-    sections = Section.objects.filter(students__id=student_id).select_related('course')
-    for section in sections:
-        if section.period_id:
-            assignments[section.period_id] = section.course.id
-    return assignments
+    return get_student_assignments_bulk([student_id]).get(student_id, {})
 
 def get_student_period_conflicts(student: User, period_id: int, current_assignments: Dict[int, Dict[int, int]], course_id: int) -> bool:
     """
@@ -70,6 +86,29 @@ def has_period_conflict(student: User, period_id: int, course_id: int) -> bool:
         logger.warning(f"Period conflict detected - Student {student.id} already has a class in period {period_id}")
     return conflicts
 
+def get_taken_periods(student_ids: List[int], course_id: int) -> Dict[int, set]:
+    """
+    Get the periods each student already spends in sections of other courses,
+    using a single query.
+    
+    Args:
+        student_ids: The IDs of the students to check
+        course_id: The current course being distributed
+    
+    Returns:
+        Dictionary mapping student IDs to the set of period IDs they are busy in
+    """
+    taken_periods = defaultdict(set)
+    enrollments = Section.students.through.objects.filter(
+        user_id__in=student_ids,
+        section__period_id__isnull=False
+    ).exclude(
+        section__course_id=course_id
+    ).values_list('user_id', 'section__period_id')
+    for student_id, period_id in enrollments:
+        taken_periods[student_id].add(period_id)
+    return taken_periods
+
 def get_grade_level_stats(grade_level: int) -> Dict[str, any]:
     """
     Get statistics for a grade level including total students and required courses.
@@ -84,6 +123,8 @@ def get_grade_level_stats(grade_level: int) -> Dict[str, any]:
     required_courses = Course.objects.filter(
         grade_level=grade_level,
         course_type='Required'  # Using 'Required' instead of 'CORE'
+    ).annotate(
+        grade_enrolled_count=Count('students', filter=Q(students__grade_level=grade_level))
     )
     
     return {
@@ -109,7 +150,7 @@ def validate_grade_level_distribution(grade_level: int) -> Dict[str, any]:
     
     # Check required course enrollment
     for course in stats['required_courses']:
-        enrolled_count = course.students.filter(grade_level=grade_level).count()
+        enrolled_count = course.grade_enrolled_count
         if enrolled_count != total_students:
             return {
                 'valid': False,
@@ -117,21 +158,19 @@ def validate_grade_level_distribution(grade_level: int) -> Dict[str, any]:
                         f"but grade {grade_level} has {total_students} total students"
             }
     
-    # Check period capacity
-    periods = Period.objects.all()
-    for period in periods:
-        # Count students in this grade level assigned to this period
-        period_count = Section.objects.filter(
-            period=period,
-            students__grade_level=grade_level
-        ).aggregate(
-            total_students=Count('students', distinct=True)
-        )['total_students'] or 0
-        
+    # Check period capacity, counting this grade's students in every period with one query
+    period_counts = Section.objects.filter(
+        period__isnull=False,
+        students__grade_level=grade_level
+    ).values('period__name').annotate(
+        total_students=Count('students', distinct=True)
+    ).order_by('period__start_time')
+    for row in period_counts:
+        period_count = row['total_students']
         if period_count > total_students:
             return {
                 'valid': False,
-                'error': f"Period {period.name} has {period_count} students from grade {grade_level}, "
+                'error': f"Period {row['period__name']} has {period_count} students from grade {grade_level}, "
                         f"which exceeds the grade level total of {total_students}"
             }
     
@@ -147,11 +186,11 @@ def validate_course_sections(course: Course) -> Dict[str, any]:
     Returns:
         Dictionary with validation results
     """
-    sections = Section.objects.filter(course=course)
-    sections_without_periods = sections.filter(period_id__isnull=True)
-    
-    if sections_without_periods.exists():
-        section_names = [s.name for s in sections_without_periods]
+    # Fetch only the names of the offending sections, in one query
+    section_names = list(
+        Section.objects.filter(course=course, period_id__isnull=True).values_list('name', flat=True)
+    )
+    if section_names:
         return {
             'valid': False,
             'error': f"Course {course.name} has sections without assigned periods: {', '.join(section_names)}"
@@ -159,129 +198,178 @@ def validate_course_sections(course: Course) -> Dict[str, any]:
     
     return {'valid': True}
 
-def distribute_course_students(course_id: int) -> Dict[str, any]:
+def assign_course_students(course: Course, sections: List[Section], registered_students: List[User]) -> Dict[str, any]:
     """
-    Distribute students for a specific course across its sections.
-    Uses randomization to ensure diverse student groupings while respecting period constraints.
+    Assign a course's already loaded students across its already loaded sections.
+    Must be called inside a transaction.
+    
+    Args:
+        course: The course being distributed
+        sections: The course's sections, with period_id and name loaded
+        registered_students: The course's registered students
+    
+    Returns:
+        Dictionary with the distribution results
     """
-    try:
-        with transaction.atomic():
-            # Get course
-            course = Course.objects.filter(id=course_id).first()
-            if not course:
-                return {'success': False, 'error': f'Course with id {course_id} not found'}
+    logger.info(f"Starting distribution for course {course.name} (ID: {course.id})")
+    # The per-student messages below are skipped entirely unless INFO is enabled
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Validate sections have periods assigned
+    section_names = [section.name for section in sections if section.period_id is None]
+    if section_names:
+        return {
+            'success': False,
+            'error': f"Course {course.name} has sections without assigned periods: {', '.join(section_names)}"
+        }
 
-            logger.info(f"Starting distribution for course {course.name} (ID: {course_id})")
+    if not registered_students:
+        return {'success': False, 'error': f'No students registered for {course.name}'}
 
-            # Validate sections have periods assigned
-            validation = validate_course_sections(course)
-            if not validation['valid']:
-                return {'success': False, 'error': validation['error']}
+    # Group students by grade level for capacity checking
+    students_by_grade = defaultdict(list)
+    for student in registered_students:
+        students_by_grade[student.grade_level].append(student)
+    grade_caps = {grade_level: len(grade_students) for grade_level, grade_students in students_by_grade.items()}
 
-            # Get all registered students for the course
-            registered_students = list(course.students.all())
-            if not registered_students:
-                return {'success': False, 'error': f'No students registered for {course.name}'}
+    # Clear existing assignments for this course with a single delete
+    Section.students.through.objects.filter(section__course_id=course.id).delete()
 
-            # Group students by grade level for capacity checking
-            students_by_grade = defaultdict(list)
-            for student in registered_students:
-                students_by_grade[student.grade_level].append(student)
+    # Track assignments per period per grade level, and per section
+    period_grade_counts = defaultdict(lambda: defaultdict(int))
+    section_students = defaultdict(list)
 
-            # Get sections for the course
-            sections = list(Section.objects.filter(course=course))
-            
-            # Clear existing assignments for this course
-            for section in sections:
-                section.students.clear()
-                logger.info(f"Section {section.name} has period {section.period_id}")
-
-            # Track assignments per period per grade level
-            period_grade_counts = defaultdict(lambda: defaultdict(int))
-
-            # Create a mapping of students to their available sections (no period conflicts)
-            student_available_sections = {}
-            for student in registered_students:
-                available_sections = []
-                for section in sections:
-                    # Check both period conflicts and grade level capacity
-                    if not has_period_conflict(student, section.period_id, course_id):
-                        # Check if adding this student would exceed grade level capacity
-                        if period_grade_counts[section.period_id][student.grade_level] < len(students_by_grade[student.grade_level]):
-                            available_sections.append(section)
-                student_available_sections[student.id] = available_sections
-                logger.info(f"Student {student.id} has {len(available_sections)} available sections")
-
-            # Sort students by number of available sections (ascending) and randomize ties
-            students_by_availability = sorted(
-                registered_students,
-                key=lambda s: (len(student_available_sections[s.id]), random.random())
+    # Load every student's periods in other courses once, instead of
+    # querying has_period_conflict() for each student and section
+    taken_periods = get_taken_periods([student.id for student in registered_students], course.id)
+
+    # Keep one min-heap of (size, random tiebreak, section id) per period, so the
+    # smallest section in a period is always at the top and is bumped in O(log n)
+    sections_by_id = {section.id: section for section in sections}
+    heap_by_period = defaultdict(list)
+    for section in sections:
+        heap_by_period[section.period_id].append((0, random.random(), section.id))
+    for period_heap in heap_by_period.values():
+        heapq.heapify(period_heap)
+
+    # Create a mapping of students to the periods they are free in (no period conflicts).
+    # Nobody is assigned yet, so grade level capacity cannot rule out a period here;
+    # it is checked in the assignment loop below
+    student_available_periods = {}
+    student_section_counts = {}
+    for student in registered_students:
+        blocked_periods = taken_periods[student.id]
+        available_periods = [
+            period_id for period_id in heap_by_period if period_id not in blocked_periods
+        ]
+        student_available_periods[student.id] = available_periods
+        student_section_counts[student.id] = sum(
+            len(heap_by_period[period_id]) for period_id in available_periods
+        )
+        if log_info:
+            logger.info("Student %s has %s available sections", student.id, student_section_counts[student.id])
+
+    # Sort students by number of available sections (ascending) and randomize ties.
+    # The sort is stable, so shuffling a copy first breaks ties uniformly
+    students_by_availability = random.sample(registered_students, len(registered_students))
+    students_by_availability.sort(key=lambda s: student_section_counts[s.id])
+
+    # Collect the enrollment rows and write them in one bulk insert after the loop
+    SectionStudent = Section.students.through
+    planned_enrollments = []
+    unassigned_students = []
+    for student in students_by_availability:
+        student_id = student.id
+        grade_level = student.grade_level
+        # Pick the smallest section among the periods that still have room for
+        # this grade; period conflicts were already excluded above
+        grade_cap = grade_caps[grade_level]
+        target_heap = None
+        for period_id in student_available_periods[student_id]:
+            if period_grade_counts[period_id][grade_level] >= grade_cap:
+                continue
+            period_heap = heap_by_period[period_id]
+            if target_heap is None or period_heap[0] < target_heap[0]:
+                target_heap = period_heap
+        
+        if target_heap is None:
+            unassigned_students.append(student)
+            logger.warning(
+                f"Cannot assign student {student.id} to course {course.name} - "
+                f"No available sections or period capacity reached"
             )
+            continue
 
-            unassigned_students = []
-            for student in students_by_availability:
-                # Double-check available sections
-                available_sections = [
-                    section for section in student_available_sections[student.id]
-                    if not has_period_conflict(student, section.period_id, course_id) and
-                    period_grade_counts[section.period_id][student.grade_level] < len(students_by_grade[student.grade_level])
-                ]
-                
-                if not available_sections:
-                    unassigned_students.append(student)
-                    logger.warning(
-                        f"Cannot assign student {student.id} to course {course.name} - "
-                        f"No available sections or period capacity reached"
-                    )
-                    continue
+        size, _, section_id = target_heap[0]
+        heapq.heapreplace(target_heap, (size + 1, random.random(), section_id))
+        target_section = sections_by_id[section_id]
+        
+        # Make the assignment
+        planned_enrollments.append(
+            SectionStudent(section_id=section_id, user_id=student_id)
+        )
+        period_grade_counts[target_section.period_id][grade_level] += 1
+        section_students[section_id].append(student)
+        if log_info:
+            logger.info(
+                "Assigned student %s (grade %s) to course %s section %s (Period: %s)",
+                student_id, grade_level, course.name, target_section.name, target_section.period_id
+            )
 
-                # Find the section with the fewest students
-                target_section = min(
-                    available_sections,
-                    key=lambda s: (s.students.count(), random.random())
-                )
-                
-                # Final conflict check before assignment
-                if has_period_conflict(student, target_section.period_id, course_id):
-                    logger.error(
-                        f"Final check - Period conflict for student {student.id} in period {target_section.period_id}"
-                    )
-                    unassigned_students.append(student)
-                    continue
-                
-                # Make the assignment
-                target_section.students.add(student)
-                period_grade_counts[target_section.period_id][student.grade_level] += 1
-                logger.info(
-                    f"Assigned student {student.id} (grade {student.grade_level}) to course {course.name} "
-                    f"section {target_section.name} (Period: {target_section.period_id})"
-                )
+    SectionStudent.objects.bulk_create(planned_enrollments, batch_size=1000, ignore_conflicts=True)
 
-            return {
-                'success': True,
-                'course_name': course.name,
-                'course_code': course.code,
-                'total_students': len(registered_students),
-                'num_sections': len(sections),
-                'unassigned_students': [
+    return {
+        'success': True,
+        'course_name': course.name,
+        'course_code': course.code,
+        'total_students': len(registered_students),
+        'num_sections': len(sections),
+        'unassigned_students': [
+            {
+                'id': student.id,
+                'first_name': student.first_name,
+                'last_name': student.last_name,
+                'reason': 'Period conflicts or capacity constraints'
+            }
+            for student in unassigned_students
+        ],
+        'distribution': [
+            {
+                'section_name': section.name,
+                'student_count': len(section_students[section.id]),
+                'period': section.period.name if section.period else None,
+                'students': [
                     {
                         'id': student.id,
                         'first_name': student.first_name,
                         'last_name': student.last_name,
-                        'reason': 'Period conflicts or capacity constraints'
+                        'grade_level': student.grade_level
                     }
-                    for student in unassigned_students
-                ],
-                'distribution': [
-                    {
-                        'section_name': section.name,
-                        'student_count': section.students.count(),
-                        'period': section.period.name if section.period else None,
-                        'students': list(section.students.values('id', 'first_name', 'last_name', 'grade_level'))
-                    }
-                    for section in sections
+                    for student in section_students[section.id]
                 ]
             }
+            for section in sections
+        ]
+    }
+
+def distribute_course_students(course_id: int) -> Dict[str, any]:
+    """
+    Distribute students for a specific course across its sections.
+    Uses randomization to ensure diverse student groupings while respecting period constraints.
+    """
+    try:
+        with transaction.atomic():
+            # Get course
+            try:
+                course = Course.objects.only('id', 'name', 'code').get(pk=course_id)
+            except Course.DoesNotExist:
+                return {'success': False, 'error': f'Course with id {course_id} not found'}
+
+            sections = list(Section.objects.filter(course=course).select_related('period'))
+            registered_students = list(
+                course.students.only('id', 'first_name', 'last_name', 'grade_level')
+            )
+            return assign_course_students(course, sections, registered_students)
 
     except Exception as e:
         logger.error(f"Error in distribute_course_students: {str(e)}")
@@ -319,7 +407,7 @@ def distribute_all_courses() -> Dict[str, any]:
                         continue
                     
                     # Get all courses in the language group
-                    courses = list(group.courses.all())
+                    courses = list(group.courses.for_scheduler())
                     if not courses:
                         language_results[group.name] = {
                             'success': False,
@@ -345,19 +433,36 @@ def distribute_all_courses() -> Dict[str, any]:
                             'sections': {}
                         }
 
-                    # Create all necessary sections first and clear them
-                    all_sections = []
-                    for course in courses:
+                    # Create all necessary sections first; their enrollments were
+                    # already removed by clear_all_distributions() above.
+                    # Each course in the group runs in its own trimester, so every
+                    # section is saved at most once here rather than once per student
+                    # Load the group's existing sections once and key them by
+                    # (course, period), keeping the first per slot as .first() did
+                    sections_by_slot = {}
+                    for section in Section.objects.filter(course__in=courses, period__in=allowed_periods):
+                        sections_by_slot.setdefault((section.course_id, section.period_id), section)
+                    retimed_sections = []
+                    for course_idx, course in enumerate(courses):
+                        trimester = course_idx + 1
+                        # Look up the next free section number once and count up from it
+                        next_section_number = course.get_next_section_number()
                         for period in allowed_periods:
-                            section = course.sections.filter(period=period).first()
+                            section = sections_by_slot.get((course.id, period.id))
                             if not section:
                                 section = Section.objects.create(
                                     course=course,
-                                    section_number=course.get_next_section_number(),
-                                    period=period
+                                    section_number=next_section_number,
+                                    period=period,
+                                    trimester=trimester
                                 )
-                            section.students.clear()
-                            all_sections.append(section)
+                                next_section_number += 1
+                            elif section.trimester != trimester:
+                                section.trimester = trimester
+                                retimed_sections.append(section)
+                            sections_by_slot[(course.id, period.id)] = section
+                    # Write every changed trimester in one bulk update
+                    Section.objects.bulk_update(retimed_sections, ['trimester'], batch_size=500)
 
                     # Calculate students per period
                     students_per_period = len(students) // len(allowed_periods)
@@ -371,6 +476,12 @@ def distribute_all_courses() -> Dict[str, any]:
                         for student in period_students:
                             student_period_assignments[student.id] = period
 
+                    # Collect the enrollment rows and write them in bulk after the loop
+                    SectionStudent = Section.students.through
+                    CourseStudent = Course.students.through
+                    section_enrollments = []
+                    course_enrollments = []
+
                     # For each period
                     for period in allowed_periods:
                         # Get students assigned to this period
@@ -381,18 +492,16 @@ def distribute_all_courses() -> Dict[str, any]:
                             # Assign them to each course in a different trimester
                             for course_idx, course in enumerate(courses):
                                 # Find the section for this course in this period
-                                section = next(s for s in all_sections if s.course == course and s.period == period)
-                                
-                                # Determine trimester (rotate based on course index)
-                                trimester = course_idx + 1
-                                
-                                # Set the trimester
-                                section.trimester = trimester
-                                section.save()
+                                section = sections_by_slot[(course.id, period.id)]
+                                trimester = section.trimester
                                 
                                 # Add student to section and course
-                                section.students.add(student)
-                                course.students.add(student)
+                                section_enrollments.append(
+                                    SectionStudent(section_id=section.id, user_id=student.id)
+                                )
+                                course_enrollments.append(
+                                    CourseStudent(course_id=course.id, user_id=student.id)
+                                )
                                 
                                 # Update course results
                                 course_results[course.name]['total_students'] += 1
@@ -410,6 +519,9 @@ def distribute_all_courses() -> Dict[str, any]:
                                     'last_name': student.last_name,
                                     'grade_level': student.grade_level
                                 })
+
+                    SectionStudent.objects.bulk_create(section_enrollments, batch_size=1000)
+                    CourseStudent.objects.bulk_create(course_enrollments, batch_size=1000)
                     
                     language_results[group.name] = {
                         'success': True,
@@ -424,15 +536,33 @@ def distribute_all_courses() -> Dict[str, any]:
             
             # Now handle regular course distribution
             results = {}
-            courses = Course.objects.exclude(
+            # Load every course's sections and students up front so each
+            # course is distributed without querying them again. The most
+            # constrained courses (fewest sections, then most students) go
+            # first, while their students' periods are still open
+            courses = Course.objects.for_scheduler().exclude(
                 id__in=LanguageGroup.objects.values_list('courses', flat=True)
-            ).filter(
-                students__isnull=False
-            ).distinct()
+            ).with_counts().filter(
+                students_count__gt=0
+            ).order_by('sections_count', '-students_count', 'id').prefetch_related(
+                Prefetch(
+                    'sections',
+                    queryset=Section.objects.select_related('period').only(
+                        'id', 'name', 'course', 'period__name'
+                    )
+                ),
+                Prefetch(
+                    'students',
+                    queryset=User.objects.only('id', 'first_name', 'last_name', 'grade_level')
+                )
+            )
             
             for course in courses:
                 try:
-                    result = distribute_course_students(course.id)
+                    with transaction.atomic():
+                        result = assign_course_students(
+                            course, list(course.sections.all()), list(course.students.all())
+                        )
                     results[course.name] = result
                 except Exception as e:
                     results[course.name] = {
@@ -455,10 +585,8 @@ def clear_course_distribution(course_id: int) -> Dict[str, bool]:
     Clear all section assignments for a specific course.
     """
     try:
-        sections = Section.objects.filter(course_id=course_id)
         with transaction.atomic():
-            for section in sections:
-                section.students.clear()
+            Section.students.through.objects.filter(section__course_id=course_id).delete()
         return {'success': True}
     except Exception as e:
         logger.error(f"Error clearing course distribution: {str(e)}")
@@ -469,10 +597,8 @@ def clear_all_distributions() -> Dict[str, bool]:
     Clear all section assignments for all courses.
     """
     try:
-        sections = Section.objects.all()
         with transaction.atomic():
-            for section in sections:
-                section.students.clear()
+            Section.students.through.objects.all().delete()
         return {'success': True}
     except Exception as e:
         logger.error(f"Error clearing all distributions: {str(e)}")
@@ -483,25 +609,42 @@ def get_course_distribution_status(course_id: int) -> Dict[str, any]:
     Get the current distribution status for a course.
     """
     try:
-        course = Course.objects.get(id=course_id)
-        sections = Section.objects.filter(course=course)
+        course = Course.objects.only('id', 'name', 'code').get(pk=course_id)
+        # Load each section's students in one prefetch query instead of two queries per section
+        sections = list(
+            Section.objects.filter(course=course).select_related('period').prefetch_related(
+                Prefetch(
+                    'students',
+                    queryset=User.objects.only('id', 'first_name', 'last_name', 'grade_level')
+                )
+            )
+        )
+        distribution = [
+            {
+                'section_name': section.name,
+                'student_count': len(section.students.all()),
+                'period': section.period.name if section.period else None,
+                'students': [
+                    {
+                        'id': student.id,
+                        'first_name': student.first_name,
+                        'last_name': student.last_name,
+                        'grade_level': student.grade_level
+                    }
+                    for student in section.students.all()
+                ]
+            }
+            for section in sections
+        ]
         
         return {
             'success': True,
             'course_name': course.name,
             'course_code': course.code,
             'total_students': course.students.count(),
-            'num_sections': sections.count(),
-            'is_distributed': sections.filter(students__isnull=False).exists(),
-            'distribution': [
-                {
-                    'section_name': section.name,
-                    'student_count': section.students.count(),
-                    'period': section.period.name if section.period else None,
-                    'students': list(section.students.values('id', 'first_name', 'last_name', 'grade_level'))
-                }
-                for section in sections
-            ]
+            'num_sections': len(sections),
+            'is_distributed': any(entry['student_count'] for entry in distribution),
+            'distribution': distribution
         }
     except Course.DoesNotExist:
         return {'success': False, 'error': f'Course with id {course_id} not found'}
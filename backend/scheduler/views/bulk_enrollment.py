@@ -8,6 +8,7 @@ from ..models import Course, User
 from ..decorators import handle_exceptions, log_execution_time
 import json
 import logging
+from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +63,13 @@ class BulkCourseEnrollmentView(View):
                     results['errors'].append(f'No students found for grade {grade}')
                     continue
                 
-                # Get all core courses for this grade
-                core_courses = Course.objects.filter(
+                # Get all core courses for this grade with their current enrollment counts
+                core_courses = list(Course.objects.filter(
                     grade_level=grade,
                     course_type='CORE'
-                )
+                ).with_counts())
                 
-                if not core_courses.exists():
+                if not core_courses:
                     results['errors'].append(f'No core courses found for grade {grade}')
                     continue
                 
@@ -76,20 +77,43 @@ class BulkCourseEnrollmentView(View):
                 if clear_existing:
                     for course in core_courses:
                         course.students.clear()
+                        course.students_count = 0
+                
+                # Track remaining space in memory instead of counting per student
+                available_space = {course.id: course.get_available_space() for course in core_courses}
+                
+                # Load who is already enrolled once, so re-running only adds new
+                # students and only real inserts use up a seat
+                CourseStudent = Course.students.through
+                enrolled_ids = defaultdict(set)
+                if not clear_existing:
+                    existing = CourseStudent.objects.filter(
+                        course_id__in=available_space
+                    ).values_list('course_id', 'user_id')
+                    for course_id, user_id in existing:
+                        enrolled_ids[course_id].add(user_id)
                 
                 # Enroll each student in all core courses
+                new_enrollments = []
                 for student in students:
                     for course in core_courses:
-                        if course.has_space_for_students(1):
-                            course.students.add(student)
+                        if student.id in enrolled_ids[course.id]:
+                            continue
+                        if available_space[course.id] > 0:
+                            new_enrollments.append(
+                                CourseStudent(course_id=course.id, user_id=student.id)
+                            )
+                            enrolled_ids[course.id].add(student.id)
+                            available_space[course.id] -= 1
                             grade_results['total_enrollments'] += 1
                         else:
                             results['errors'].append(
                                 f'Course {course.name} is at capacity - could not enroll all students'
                             )
+                CourseStudent.objects.bulk_create(new_enrollments, batch_size=1000)
                 
                 grade_results['students_processed'] = students.count()
-                grade_results['courses_processed'] = core_courses.count()
+                grade_results['courses_processed'] = len(core_courses)
                 results['enrollments'][grade] = grade_results
                 
                 # Clear relevant caches
@@ -3,7 +3,6 @@ from django.views import View
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction
-from django.core.cache import cache
 from ..models import (
     SchedulingConfiguration,
     CourseTypeConfiguration
@@ -26,7 +25,7 @@ class BaseConfigurationView(View):
     @log_execution_time
     def get(self, request):
         """Get active configuration"""
-        config = self.model.objects.filter(active=True).first()
+        config = self.model.get_active()
         if not config:
             return JsonResponse({'error': 'No active configuration found'}, status=404)
         
@@ -60,9 +59,6 @@ class BaseConfigurationView(View):
             config.full_clean()
             config.save()
             
-            # Clear cache
-            cache.delete(f'{self.model.__name__}_active')
-            
             return JsonResponse({
                 field: getattr(config, field)
                 for field in self.fields
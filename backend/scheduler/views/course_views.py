@@ -80,7 +80,7 @@ class CourseStudentView(APIView):
         
         if course is None:
             course = get_object_or_404(
-                Course.objects.prefetch_related('students', 'sections__students'),
+                Course.objects.with_stats(),
                 id=course_id
             )
             cache.set(cache_key, course, CACHE_TIMEOUT)
@@ -92,7 +92,7 @@ class CourseStudentView(APIView):
     def get(self, request: HttpRequest, course_id: int, student_id: Optional[int] = None) -> JsonResponse:
         """Handle GET requests for course students"""
         course = self.get_course_with_students(course_id)
-        config = CourseTypeConfiguration.objects.filter(active=True).first()
+        config = CourseTypeConfiguration.get_active()
         
         # Get registered students
         students_data = list(course.students.values(
@@ -144,7 +144,7 @@ class CourseStudentView(APIView):
     def post(self, request: HttpRequest, course_id: int, student_id: Optional[int] = None) -> JsonResponse:
         """Handle POST requests for adding/removing students"""
         course = get_object_or_404(Course, id=course_id)
-        config = CourseTypeConfiguration.objects.filter(active=True).first()
+        config = CourseTypeConfiguration.get_active()
         
         # If URL ends with /remove-all-students/, remove all students
         if 'remove-all-students' in request.path: